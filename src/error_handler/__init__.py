@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING
 from .context_manager import context_manager
 from .decorator import decorator, decorator_as_result, retry_on_error
 from .result import NegativeResult, PositiveResult, ResultType
+from .scheduler import RetryScheduler
 from .types import UNSET, AsyncFunctionType, FunctionType, SecuredAsyncFunctionType, SecuredFunctionType, UnsetType
 
 if TYPE_CHECKING:
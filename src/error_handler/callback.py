@@ -5,9 +5,11 @@ arguments. Just in case that the type checker is not able to spot callback funct
 """
 
 import inspect
+import types
+import weakref
 from typing import Any, Callable, Generic, ParamSpec, Sequence, TypeVar, cast
 
-from .types import UNSET
+from .types import _CALLBACK_ERROR_PARAM, _EMPTY_SIGNATURE, UNSET
 
 _P = ParamSpec("_P")
 _T = TypeVar("_T")
@@ -16,15 +18,48 @@ _ErrorCallbackT = TypeVar("_ErrorCallbackT", bound="ErrorCallback")
 _SuccessCallbackT = TypeVar("_SuccessCallbackT", bound="SuccessCallback")
 
 
+_SIGNATURE_CACHE: "weakref.WeakKeyDictionary[Callable, inspect.Signature]" = weakref.WeakKeyDictionary()
+"""
+Signatures of callables which were already inspected. It is shared between all Callback instances and weakly
+references its keys, so it won't keep otherwise unused callables (e.g. lambdas) alive.
+"""
+
+
+def _cached_signature(callable_: Callable) -> inspect.Signature:
+    """
+    Returns the signature of the given callable. Since inspect.signature is rather expensive and the same callables
+    are secured over and over again, the results are cached. Callables which cannot be weakly referenced
+    (e.g. builtins) are not cached, so the cache never keeps a callable alive.
+    """
+    try:
+        signature = _SIGNATURE_CACHE.get(callable_)
+    except TypeError:
+        return inspect.signature(callable_)
+    if signature is None:
+        signature = inspect.signature(callable_)
+        _SIGNATURE_CACHE[callable_] = signature
+    return signature
+
+
 class Callback(Generic[_P, _T]):
     """
     This class wraps a callable and its expected signature.
     """
 
+    __slots__ = ("callback", "expected_signature", "_actual_signature", "_call_directly", "__weakref__")
+
     def __init__(self, callback: Callable[_P, _T], expected_signature: inspect.Signature):
         self.callback = callback
         self.expected_signature = expected_signature
         self._actual_signature: inspect.Signature | None = None
+        # Only plain functions and methods are guaranteed to raise a TypeError for wrong arguments before their body
+        # runs, and to match their reported signature. Wrapped callables (e.g. via functools.wraps), callables with an
+        # explicit __signature__ and other callable objects get their arguments checked before the call.
+        self._call_directly = (
+            isinstance(callback, (types.FunctionType, types.MethodType))
+            and not hasattr(callback, "__wrapped__")
+            and not hasattr(callback, "__signature__")
+        )
 
     @property
     def actual_signature(self) -> inspect.Signature:
@@ -32,7 +67,7 @@ class Callback(Generic[_P, _T]):
         The actual signature of the callback
         """
         if self._actual_signature is None:
-            self._actual_signature = inspect.signature(self.callback)
+            self._actual_signature = _cached_signature(self.callback)
         return self._actual_signature
 
     @property
@@ -60,21 +95,21 @@ class Callback(Generic[_P, _T]):
         """
         Create a new Callback instance from a callable. The expected signature will be taken from the
         signature_from_callable. You can add additional parameters or change the return type for the
-        expected signature.
+        expected signature. If `return_type` is not set or None, the return annotation is kept.
         """
         if signature_from_callable is None:
-            sig = inspect.Signature()
+            sig = _EMPTY_SIGNATURE
         elif isinstance(signature_from_callable, inspect.Signature):
             sig = signature_from_callable
         else:
-            sig = inspect.signature(signature_from_callable)
-        if add_params is not None or return_type is not None:
-            params = list(sig.parameters.values())
-            if add_params is not None:
-                params = [*add_params, *params]
-            if return_type is UNSET:
-                return_type = sig.return_annotation
-            sig = sig.replace(parameters=params, return_annotation=return_type)
+            sig = _cached_signature(signature_from_callable)
+        if return_type is None:
+            return_type = UNSET
+        if add_params or return_type is not UNSET:
+            sig = sig.replace(
+                parameters=(*(add_params or ()), *sig.parameters.values()),
+                return_annotation=sig.return_annotation if return_type is UNSET else return_type,
+            )
         return cls(callback, sig)
 
     def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> _T:
@@ -83,17 +118,34 @@ class Callback(Generic[_P, _T]):
         expected signature. If the callback does not match the expected signature, a TypeError explaining which
         signature was expected will be raised.
         """
+        if self._call_directly:
+            try:
+                return self.callback(*args, **kwargs)
+            except TypeError as error:
+                # Binding the arguments against the signature on every call is expensive. Instead, call the callback
+                # directly and only check the signature if a TypeError was raised by the call itself (i.e. not from
+                # inside the callback).
+                assert error.__traceback__ is not None
+                if error.__traceback__.tb_next is not None or self._arguments_match_signature(*args, **kwargs):
+                    raise
+        elif self._arguments_match_signature(*args, **kwargs):
+            return self.callback(*args, **kwargs)
+        # This is raised outside the except block on purpose because the original exception is less helpful and
+        # spams the stack trace.
+        raise TypeError(
+            f"Arguments do not match signature of callback {self.callback.__name__}{self.actual_signature_str}. "
+            f"Callback function must match signature: {self.callback.__name__}{self.expected_signature_str}"
+        )
+
+    def _arguments_match_signature(self, *args: Any, **kwargs: Any) -> bool:
+        """
+        Returns True if the given arguments can be bound to the actual signature of the callback.
+        """
         try:
-            filled_signature = self.actual_signature.bind(*args, **kwargs)
+            self.actual_signature.bind(*args, **kwargs)
         except TypeError:
-            # pylint: disable=raise-missing-from
-            # I decided to leave this out because the original exception is less helpful and spams the stack trace.
-            # Please read: https://docs.python.org/3/library/exceptions.html#BaseException.__suppress_context__
-            raise TypeError(
-                f"Arguments do not match signature of callback {self.callback.__name__}{self.actual_signature_str}. "
-                f"Callback function must match signature: {self.callback.__name__}{self.expected_signature_str}"
-            ) from None
-        return self.callback(*filled_signature.args, **filled_signature.kwargs)
+            return False
+        return True
 
 
 class ErrorCallback(Callback[_P, _T]):
@@ -102,9 +154,9 @@ class ErrorCallback(Callback[_P, _T]):
     signature.
     """
 
-    _CALLBACK_ERROR_PARAM = inspect.Parameter(
-        "error", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=BaseException
-    )
+    __slots__ = ()
+
+    _CALLBACK_ERROR_PARAM = _CALLBACK_ERROR_PARAM
 
     @classmethod
     def from_callable(
@@ -115,11 +167,11 @@ class ErrorCallback(Callback[_P, _T]):
         return_type: Any = UNSET,
     ) -> _ErrorCallbackT:
         if add_params is None:
-            add_params = []
+            add_params = ()
         inst = cast(
             _ErrorCallbackT,
             super().from_callable(
-                callback, signature_from_callable, [cls._CALLBACK_ERROR_PARAM, *add_params], return_type
+                callback, signature_from_callable, (cls._CALLBACK_ERROR_PARAM, *add_params), return_type
             ),
         )
         return inst
@@ -131,6 +183,8 @@ class SuccessCallback(Callback[_P, _T]):
     signature. The annotation type is taken from the return annotation of the `signature_from_callable`.
     """
 
+    __slots__ = ()
+
     @classmethod
     def from_callable(
         cls: type[_SuccessCallbackT],
@@ -146,7 +200,7 @@ class SuccessCallback(Callback[_P, _T]):
         if return_type is UNSET:
             return_type = inst.expected_signature.return_annotation
         inst.expected_signature = inst.expected_signature.replace(
-            parameters=[add_param, *inst.expected_signature.parameters.values()],
+            parameters=(add_param, *inst.expected_signature.parameters.values()),
             return_annotation=return_type,
         )
         return inst
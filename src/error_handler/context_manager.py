@@ -7,7 +7,7 @@ from typing import Any, Callable, Iterator
 
 from .callback import Callback, ErrorCallback
 from .core import Catcher, ContextCatcher
-from .types import UnsetType
+from .types import _EMPTY_ANY_SIGNATURE, UnsetType
 
 
 # pylint: disable=unsubscriptable-object
@@ -30,9 +30,9 @@ def context_manager(
     caught by a previous catcher.
     """
     catcher = ContextCatcher(
-        Callback.from_callable(on_success, return_type=Any) if on_success is not None else None,
-        ErrorCallback.from_callable(on_error, return_type=Any) if on_error is not None else None,
-        Callback.from_callable(on_finalize, return_type=Any) if on_finalize is not None else None,
+        Callback.from_callable(on_success, _EMPTY_ANY_SIGNATURE) if on_success is not None else None,
+        ErrorCallback.from_callable(on_error, _EMPTY_ANY_SIGNATURE) if on_error is not None else None,
+        Callback.from_callable(on_finalize, _EMPTY_ANY_SIGNATURE) if on_finalize is not None else None,
         suppress_recalling_on_error=suppress_recalling_on_error,
     )
     with catcher.secure_context():
@@ -5,7 +5,6 @@ methods to surround statements with try-except blocks and calls corresponding ca
 
 # pylint: disable=undefined-variable
 # Seems like pylint doesn't like the new typing features. It has a problem with the generic T of class Catcher.
-import inspect
 from contextlib import contextmanager
 from typing import Any, Awaitable, Callable, Generic, Iterator, ParamSpec, Self, TypeVar
 
@@ -26,7 +25,21 @@ _U = TypeVar("_U")
 _P = ParamSpec("_P")
 
 
-_CALLBACK_ERROR_PARAM = inspect.Parameter("error", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=BaseException)
+_SKIPPED_CALLBACK_SUMMARY = CallbackSummary(
+    callback_result_types=CallbackResultTypes(),
+    callback_return_values=ReturnValues(),
+)
+"""
+The summary if no callback was called. It is shared since there is nothing to tell apart if there are no callbacks.
+"""
+_POSITIVE_NONE_RESULT: PositiveResult[Any] = PositiveResult(result=None)
+"""
+The result of secured callables returning None. Results are immutable, so the same instance can be shared.
+"""
+_POSITIVE_UNSET_RESULT: PositiveResult[UnsetType] = PositiveResult(result=UNSET)
+"""
+The result of a secured context which didn't raise an error.
+"""
 
 
 # pylint: disable=too-many-instance-attributes
@@ -37,6 +50,17 @@ class Catcher(Generic[T]):
     called accordingly.
     """
 
+    __slots__ = (
+        "on_success",
+        "on_error",
+        "on_finalize",
+        "suppress_recalling_on_error",
+        "_result",
+        "raise_callback_errors",
+        "no_wrap_exception_group_when_reraise",
+        "__weakref__",
+    )
+
     # pylint: disable=too-many-positional-arguments, too-many-arguments
     def __init__(
         self,
@@ -75,79 +99,74 @@ class Catcher(Generic[T]):
         """
         This method marks the given exception as handled by the catcher.
         """
-        if not hasattr(error, "__caught_by_catcher__"):
-            error.__caught_by_catcher__ = []  # type: ignore[attr-defined]
-        error.__caught_by_catcher__.append(self)  # type: ignore[attr-defined]
+        error.__dict__.setdefault("__caught_by_catcher__", []).append(self)
 
     @staticmethod
-    def _call_callback(callback: Callback | None, *args: Any, **kwargs: Any) -> tuple[Any, CallbackResultType]:
-        callback_result = CallbackResultType.SKIPPED
-        callback_return_value: Any = UNSET
-        if callback is not None:
-            try:
-                callback_return_value = callback(*args, **kwargs)
-                callback_result = CallbackResultType.SUCCESS
-            except BaseException as callback_error:  # pylint: disable=broad-exception-caught
-                callback_return_value = callback_error
-                callback_result = CallbackResultType.ERROR
-        return callback_return_value, callback_result
+    def _call_callback(
+        callback: Callback | None, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[Any, CallbackResultType]:
+        """
+        Calls the callback if it is set. The arguments are passed as tuple and dict (instead of unpacked) to avoid
+        packing them again for each callback.
+        """
+        if callback is None:
+            return UNSET, CallbackResultType.SKIPPED
+        try:
+            return callback(*args, **kwargs), CallbackResultType.SUCCESS
+        except BaseException as callback_error:  # pylint: disable=broad-exception-caught
+            return callback_error, CallbackResultType.ERROR
 
     def _raise_callback_errors_if_set(self, result: CallbackSummary, raise_from: BaseException | None = None) -> None:
         if not self.raise_callback_errors:
             return
+        result_types = result.callback_result_types
+        return_values = result.callback_return_values
         excs = []
-        if result.callback_result_types.success == CallbackResultType.ERROR:
-            excs.append(result.callback_return_values.success)
-        if result.callback_result_types.error == CallbackResultType.ERROR:
-            excs.append(result.callback_return_values.error)
-        if result.callback_result_types.finalize == CallbackResultType.ERROR:
-            excs.append(result.callback_return_values.finalize)
+        if result_types.success is CallbackResultType.ERROR:
+            excs.append(return_values.success)
+        if result_types.error is CallbackResultType.ERROR:
+            excs.append(return_values.error)
+        if result_types.finalize is CallbackResultType.ERROR:
+            excs.append(return_values.finalize)
+        if not excs:
+            return
 
         if self.no_wrap_exception_group_when_reraise and len(excs) == 1 and raise_from is excs[0]:
             raise raise_from
-        if len(excs) > 0:
-            exc_group = BaseExceptionGroup("There were one or more errors while calling the callback functions.", excs)
-            if raise_from is not None:
-                exc_group.__context__ = raise_from
-            raise exc_group
+        exc_group = BaseExceptionGroup("There were one or more errors while calling the callback functions.", excs)
+        if raise_from is not None:
+            exc_group.__context__ = raise_from
+        raise exc_group
 
-    def _handle_error_callback(self, error: BaseException, *args: Any, **kwargs: Any) -> tuple[Any, CallbackResultType]:
+    def _handle_error_callback(
+        self, error: BaseException, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> tuple[Any, CallbackResultType]:
         """
         This method handles the given exception.
         """
         return_value = UNSET
         result = CallbackResultType.SKIPPED
-        caught_before = hasattr(error, "__caught_by_catcher__")
+        caught_before = "__caught_by_catcher__" in error.__dict__
         self._mark_exception(error)
         if not (caught_before and self.suppress_recalling_on_error):
-            return_value, result = self._call_callback(self.on_error, error, *args, **kwargs)
+            return_value, result = self._call_callback(self.on_error, (error, *args), kwargs)
             if result == CallbackResultType.ERROR and return_value is error:
                 assert self.on_error is not None, "Internal error: on_error is None but result is ERROR"
                 error.add_note(f"This error was reraised by on_error callback {self.on_error.callback.__name__}")
 
         return return_value, result
 
-    def _handle_success_callback(self, *args: Any, **kwargs: Any) -> tuple[Any, CallbackResultType]:
-        """
-        This method handles the given result.
-        """
-        return self._call_callback(self.on_success, *args, **kwargs)
-
-    def _handle_finalize_callback(self, *args: Any, **kwargs: Any) -> tuple[Any, CallbackResultType]:
-        """
-        This method handles the finalize case.
-        """
-        return self._call_callback(self.on_finalize, *args, **kwargs)
-
     def handle_success_case(self, result: T | UnsetType, *args: Any, **kwargs: Any) -> CallbackSummary:
         """
         This method handles the success case.
         """
+        if self.on_success is None and self.on_finalize is None:
+            return _SKIPPED_CALLBACK_SUMMARY
         if result is UNSET:
-            success_return_value, success_result = self._handle_success_callback(*args, **kwargs)
+            success_return_value, success_result = self._call_callback(self.on_success, args, kwargs)
         else:
-            success_return_value, success_result = self._handle_success_callback(result, *args, **kwargs)
-        finalize_return_value, finalize_result = self._handle_finalize_callback(*args, **kwargs)
+            success_return_value, success_result = self._call_callback(self.on_success, (result, *args), kwargs)
+        finalize_return_value, finalize_result = self._call_callback(self.on_finalize, args, kwargs)
         callback_result = CallbackSummary(
             callback_result_types=CallbackResultTypes(
                 success=success_result,
@@ -165,8 +184,11 @@ class Catcher(Generic[T]):
         """
         This method handles the error case.
         """
-        error_return_value, error_result = self._handle_error_callback(error, *args, **kwargs)
-        finalize_return_value, finalize_result = self._handle_finalize_callback(*args, **kwargs)
+        if self.on_error is None and self.on_finalize is None:
+            self._mark_exception(error)
+            return _SKIPPED_CALLBACK_SUMMARY
+        error_return_value, error_result = self._handle_error_callback(error, args, kwargs)
+        finalize_return_value, finalize_result = self._call_callback(self.on_finalize, args, kwargs)
         callback_result = CallbackSummary(
             callback_result_types=CallbackResultTypes(
                 error=error_result,
@@ -188,7 +210,7 @@ class Catcher(Generic[T]):
             return self.handle_success_case(result.result, *args, **kwargs)
         return self.handle_error_case(result.error, *args, **kwargs)
 
-    def secure_call(  # type: ignore[return]  # Because mypy is stupid, idk.
+    def secure_call(
         self,
         callable_to_secure: Callable[_P, T],
         *args: _P.args,
@@ -202,14 +224,17 @@ class Catcher(Generic[T]):
         provided to the callback if it receives an argument) and the return value will be propagated.
         The on_finalize callback will be called in both cases and after the other callbacks.
         """
+        # The result is kept in a local variable to return it without going through the result property.
+        secured_result: ResultType[T]
         try:
-            result = callable_to_secure(*args, **kwargs)
-            self._result = PositiveResult(result=result)
+            return_value = callable_to_secure(*args, **kwargs)
+            secured_result = _POSITIVE_NONE_RESULT if return_value is None else PositiveResult(result=return_value)
         except BaseException as error:  # pylint: disable=broad-exception-caught
-            self._result = NegativeResult(error=error)
-        return self.result
+            secured_result = NegativeResult(error=error)
+        self._result = secured_result
+        return secured_result
 
-    async def secure_await(  # type: ignore[return]  # Because mypy is stupid, idk.
+    async def secure_await(
         self,
         awaitable_to_secure: Awaitable[T],
     ) -> ResultType[T]:
@@ -221,12 +246,15 @@ class Catcher(Generic[T]):
         provided to the callback if it receives an argument) and the return value will be propagated.
         The on_finalize callback will be called in both cases and after the other callbacks.
         """
+        # The result is kept in a local variable to return it without going through the result property.
+        secured_result: ResultType[T]
         try:
-            result = await awaitable_to_secure
-            self._result = PositiveResult(result=result)
+            return_value = await awaitable_to_secure
+            secured_result = _POSITIVE_NONE_RESULT if return_value is None else PositiveResult(result=return_value)
         except BaseException as error:  # pylint: disable=broad-exception-caught
-            self._result = NegativeResult(error=error)
-        return self.result
+            secured_result = NegativeResult(error=error)
+        self._result = secured_result
+        return secured_result
 
 
 class ContextCatcher(Catcher[UnsetType]):
@@ -234,6 +262,8 @@ class ContextCatcher(Catcher[UnsetType]):
     This class is a special case of the Catcher class. It is meant to use the context manager.
     """
 
+    __slots__ = ()
+
     @contextmanager
     def secure_context(self) -> Iterator[Self]:
         """
@@ -247,6 +277,6 @@ class ContextCatcher(Catcher[UnsetType]):
         """
         try:
             yield self
-            self._result = PositiveResult(result=UNSET)
+            self._result = _POSITIVE_UNSET_RESULT
         except BaseException as error:  # pylint: disable=broad-exception-caught
             self._result = NegativeResult(error=error)
@@ -7,11 +7,12 @@ import functools
 import inspect
 import logging
 import time
-from typing import Any, Callable, Concatenate, Generator, ParamSpec, Protocol, TypeGuard, TypeVar, cast, overload
+from typing import Any, Awaitable, Callable, Concatenate, ParamSpec, Protocol, TypeGuard, TypeVar, cast, overload
 
-from .callback import Callback, ErrorCallback, SuccessCallback
+from .callback import Callback, ErrorCallback, SuccessCallback, _cached_signature
 from .core import Catcher
 from .result import CallbackResultType, PositiveResult, ResultType
+from .scheduler import RetryScheduler
 from .types import UNSET, AsyncFunctionType, FunctionType, SecuredAsyncFunctionType, SecuredFunctionType, UnsetType
 
 _P = ParamSpec("_P")
@@ -23,7 +24,12 @@ def iscoroutinefunction(
 ) -> TypeGuard[AsyncFunctionType[_P, _T]]:
     """
     This function checks if the given callable is a coroutine function.
+    Plain `async def` functions are detected directly by the flags of their code object. Everything else (e.g.
+    partials or callables marked as coroutine functions) is left to asyncio.iscoroutinefunction.
     """
+    code = getattr(callable_, "__code__", None)
+    if code is not None and code.co_flags & inspect.CO_COROUTINE:  # pylint: disable=no-member
+        return True
     return asyncio.iscoroutinefunction(callable_)
 
 
@@ -80,6 +86,42 @@ class Decorator(Protocol[_P, _T]):
     ) -> FunctionType[_P, _T] | AsyncFunctionType[_P, _T]: ...
 
 
+def _build_secured_async(
+    callable_to_secure: AsyncFunctionType[_P, _T], catcher: Catcher[_T]
+) -> SecuredAsyncFunctionType[_P, _T]:
+    """
+    Builds the wrapper of decorator_as_result for coroutine functions.
+    """
+    # Resolve the bound methods once instead of looking them up on every call of the wrapper.
+    secure_await = catcher.secure_await
+    handle_result_and_call_callbacks = catcher.handle_result_and_call_callbacks
+
+    @functools.wraps(callable_to_secure)
+    async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> ResultType[_T]:
+        result = await secure_await(callable_to_secure(*args, **kwargs))
+        handle_result_and_call_callbacks(result, *args, **kwargs)
+        return result
+
+    return cast(SecuredAsyncFunctionType[_P, _T], wrapper)
+
+
+def _build_secured_sync(callable_to_secure: FunctionType[_P, _T], catcher: Catcher[_T]) -> SecuredFunctionType[_P, _T]:
+    """
+    Builds the wrapper of decorator_as_result for sync functions.
+    """
+    # Resolve the bound methods once instead of looking them up on every call of the wrapper.
+    secure_call = catcher.secure_call
+    handle_result_and_call_callbacks = catcher.handle_result_and_call_callbacks
+
+    @functools.wraps(callable_to_secure)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> ResultType[_T]:
+        result = secure_call(callable_to_secure, *args, **kwargs)
+        handle_result_and_call_callbacks(result, *args, **kwargs)
+        return result
+
+    return cast(SecuredFunctionType[_P, _T], wrapper)
+
+
 # pylint: disable=too-many-arguments
 def decorator_as_result(
     *,
@@ -112,46 +154,127 @@ def decorator_as_result(
     def decorator_inner(
         callable_to_secure: FunctionType[_P, _T] | AsyncFunctionType[_P, _T]
     ) -> SecuredFunctionType[_P, _T] | SecuredAsyncFunctionType[_P, _T]:
-        sig = inspect.signature(callable_to_secure)
-        catcher = Catcher[_T](
-            SuccessCallback.from_callable(on_success, sig, return_type=Any) if on_success is not None else None,
-            ErrorCallback.from_callable(on_error, sig, return_type=Any) if on_error is not None else None,
-            Callback.from_callable(on_finalize, sig, return_type=Any) if on_finalize is not None else None,
-            suppress_recalling_on_error,
-        )
+        if on_success is None and on_error is None and on_finalize is None:
+            # No need to inspect the signature if there are no callbacks to check against it.
+            catcher = Catcher[_T](suppress_recalling_on_error=suppress_recalling_on_error)
+        else:
+            sig = _cached_signature(callable_to_secure)
+            catcher = Catcher[_T](
+                SuccessCallback.from_callable(on_success, sig, return_type=Any) if on_success is not None else None,
+                ErrorCallback.from_callable(on_error, sig, return_type=Any) if on_error is not None else None,
+                Callback.from_callable(on_finalize, sig, return_type=Any) if on_finalize is not None else None,
+                suppress_recalling_on_error,
+            )
+        wrapper: SecuredFunctionType[_P, _T] | SecuredAsyncFunctionType[_P, _T]
         if iscoroutinefunction(callable_to_secure):
+            wrapper = _build_secured_async(callable_to_secure, catcher)
+        else:
+            wrapper = _build_secured_sync(callable_to_secure, catcher)  # type: ignore[arg-type]
+        wrapper.__catcher__ = catcher
+        wrapper.__original_callable__ = callable_to_secure
+        return wrapper
 
-            @functools.wraps(callable_to_secure)
-            async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> ResultType[_T]:
-                result = await catcher.secure_await(callable_to_secure(*args, **kwargs))
-                catcher.handle_result_and_call_callbacks(result, *args, **kwargs)
-                return result
+    return decorator_inner
 
-        else:
 
-            @functools.wraps(callable_to_secure)
-            def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> ResultType[_T]:
-                result = catcher.secure_call(
-                    callable_to_secure,  # type: ignore[arg-type]
-                    *args,
-                    **kwargs,
-                )
-                catcher.handle_result_and_call_callbacks(result, *args, **kwargs)
-                return result
-
-        return_func = cast(SecuredFunctionType[_P, _T] | SecuredAsyncFunctionType[_P, _T], wrapper)
-        return_func.__catcher__ = catcher
-        return_func.__original_callable__ = callable_to_secure
-        return return_func
+def exponential_backoff(retry_count: int) -> float:
+    """
+    The default retry_stepping_func of retry_on_error. The time to wait grows exponentially with the retry count.
+    """
+    return 1.71**retry_count
 
-    return decorator_inner
+
+def _should_retry(
+    catcher_executor: Catcher[_T], error: BaseException, retry_count: int, *args: Any, **kwargs: Any
+) -> bool:
+    """
+    Calls the on_error callback of retry_on_error and returns whether the secured callable should be retried.
+    """
+    callback_summary = catcher_executor.handle_error_case(error, retry_count, *args, **kwargs)
+    assert (
+        callback_summary.callback_result_types.error == CallbackResultType.SUCCESS
+    ), "Internal error: on_error callback was not successful but didn't raise exception"
+    return callback_summary.callback_return_values.error is True
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def _build_retry_async(
+    callable_to_secure: AsyncFunctionType[_P, _T],
+    catcher_executor: Catcher[_T],
+    catcher_retrier: Catcher[_T],
+    get_wait_time: Callable[[int], float],
+    max_retries: int,
+    sleep: Callable[[float], Awaitable[None]],
+) -> AsyncFunctionType[_P, _T]:
+    """
+    Builds the wrapper of retry_on_error for coroutine functions.
+    """
+
+    @functools.wraps(callable_to_secure)
+    async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+        retry_count = 0
+        try:
+            for retry_count in range(max_retries):
+                try:
+                    return_value = await callable_to_secure(*args, **kwargs)
+                    break
+                except BaseException as error:  # pylint: disable=broad-exception-caught
+                    if not _should_retry(catcher_executor, error, retry_count, *args, **kwargs):
+                        raise
+                await sleep(get_wait_time(retry_count))
+            else:
+                retry_count = max_retries
+                raise RuntimeError(f"Too many retries ({max_retries}) for {callable_to_secure.__name__}")
+        except BaseException as error:
+            catcher_retrier.handle_error_case(error, retry_count, *args, **kwargs)
+            raise
+        catcher_retrier.handle_success_case(return_value, retry_count, *args, **kwargs)
+        return return_value
+
+    return wrapper
+
+
+# pylint: disable=too-many-arguments, too-many-positional-arguments
+def _build_retry_sync(
+    callable_to_secure: FunctionType[_P, _T],
+    catcher_executor: Catcher[_T],
+    catcher_retrier: Catcher[_T],
+    get_wait_time: Callable[[int], float],
+    max_retries: int,
+) -> FunctionType[_P, _T]:
+    """
+    Builds the wrapper of retry_on_error for sync functions.
+    """
+
+    @functools.wraps(callable_to_secure)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+        retry_count = 0
+        try:
+            for retry_count in range(max_retries):
+                try:
+                    return_value = callable_to_secure(*args, **kwargs)
+                    break
+                except BaseException as error:  # pylint: disable=broad-exception-caught
+                    if not _should_retry(catcher_executor, error, retry_count, *args, **kwargs):
+                        raise
+                time.sleep(get_wait_time(retry_count))
+            else:
+                retry_count = max_retries
+                raise RuntimeError(f"Too many retries ({max_retries}) for {callable_to_secure.__name__}")
+        except BaseException as error:
+            catcher_retrier.handle_error_case(error, retry_count, *args, **kwargs)
+            raise
+        catcher_retrier.handle_success_case(return_value, retry_count, *args, **kwargs)
+        return return_value
+
+    return wrapper
 
 
 # pylint: disable=too-many-arguments, too-many-locals
 def retry_on_error(
     *,
     on_error: Callable[Concatenate[BaseException, int, _P], bool],
-    retry_stepping_func: Callable[[int], float] = lambda retry_count: 1.71**retry_count,
+    retry_stepping_func: Callable[[int], float] = exponential_backoff,
     # <-- with max_retries = 10 the whole decorator may wait up to 5 minutes.
     # because sum(1.71seconds**i for i in range(10)) == 5minutes
     max_retries: int = 10,
@@ -159,6 +282,7 @@ def retry_on_error(
     on_fail: Callable[Concatenate[BaseException, int, _P], Any] | None = None,
     on_finalize: Callable[Concatenate[int, _P], Any] | None = None,
     logger: logging.Logger = logging.getLogger(__name__),
+    retry_scheduler: RetryScheduler | None = None,
 ) -> Decorator[_P, _T]:
     """
     This decorator retries a callable (sync or async) on error.
@@ -169,17 +293,19 @@ def retry_on_error(
     The function fails immediately, if the on_error callback returns False or if the max_retries are reached.
     In this case, the on_fail callback will be called and the respective error will be raised.
     You can additionally use the normal decorator on top of that if you don't want an exception to be raised.
+    If a retry_scheduler is given, async functions wait for their retries through it instead of asyncio.sleep. Share
+    a scheduler between many decorated functions to let concurrent retries share the timers of the event loop.
     """
 
     def decorator_inner(
         callable_to_secure: FunctionType[_P, _T] | AsyncFunctionType[_P, _T]
     ) -> FunctionType[_P, _T] | AsyncFunctionType[_P, _T]:
-        sig = inspect.signature(callable_to_secure)
+        sig = _cached_signature(callable_to_secure)
         sig = sig.replace(
-            parameters=[
+            parameters=(
                 inspect.Parameter("retries", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=int),
                 *sig.parameters.values(),
-            ],
+            ),
         )
         on_error_callback: ErrorCallback[Concatenate[BaseException, int, _P], bool] = ErrorCallback.from_callable(
             on_error, sig, return_type=bool
@@ -202,92 +328,35 @@ def retry_on_error(
             on_finalize=on_finalize_callback,
             suppress_recalling_on_error=False,
         )
-        retry_count = 0
-
-        def retry_generator(*args: _P.args, **kwargs: _P.kwargs) -> Generator[int, ResultType[_T], _T]:
-            nonlocal retry_count
-            for retry_count_i in range(max_retries):
-                result: ResultType[_T] = yield retry_count_i
-                retry_count = retry_count_i
-                if isinstance(result, PositiveResult):
-                    assert not isinstance(result.result, UnsetType), "Internal error: result is unset"
-                    return result.result
-                callback_summary = catcher_executor.handle_result_and_call_callbacks(
-                    result, retry_count_i, *args, **kwargs
-                )
-                assert (
-                    callback_summary.callback_result_types.error == CallbackResultType.SUCCESS
-                ), "Internal error: on_error callback was not successful but didn't raise exception"
-                if callback_summary.callback_return_values.error is True:
-                    yield retry_count_i
-                    continue
-                # Should not retry
-                raise result.error
-
-            retry_count = max_retries
-            error = RuntimeError(f"Too many retries ({max_retries}) for {callable_to_secure.__name__}")
-            raise error
-
-        def handle_result_and_call_callbacks(result: ResultType[_T], *args: _P.args, **kwargs: _P.kwargs) -> _T:
-            if isinstance(result, PositiveResult):
-                catcher_retrier.handle_success_case(
-                    result.result,
-                    retry_count,
-                    *args,
-                    **kwargs,
-                )
-                return result.result
-
-            catcher_retrier.handle_error_case(result.error, retry_count, *args, **kwargs)
-            raise result.error
-
+        wrapper: FunctionType[_P, _T] | AsyncFunctionType[_P, _T]
         if iscoroutinefunction(callable_to_secure):
-
-            async def retry_function_async(*args: _P.args, **kwargs: _P.kwargs) -> _T:
-                generator = retry_generator(*args, **kwargs)
-                while True:
-                    next(generator)
-                    try:
-                        retry_count_ = generator.send(
-                            await catcher_executor.secure_await(callable_to_secure(*args, **kwargs))
-                        )
-                    except StopIteration as stop_iteration:
-                        return stop_iteration.value
-                    await asyncio.sleep(retry_stepping_func(retry_count_))
-
-            @functools.wraps(callable_to_secure)
-            async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
-                result = await catcher_retrier.secure_await(retry_function_async(*args, **kwargs))
-                return handle_result_and_call_callbacks(result, *args, **kwargs)
-
+            wrapper = _build_retry_async(
+                callable_to_secure,
+                catcher_executor,
+                catcher_retrier,
+                retry_stepping_func,
+                max_retries,
+                retry_scheduler.sleep if retry_scheduler is not None else asyncio.sleep,
+            )
         else:
+            if retry_scheduler is not None:
+                raise ValueError("A retry_scheduler can only be used to retry async functions.")
             logger.warning(
                 "Sync retry decorator is dangerous as it uses time.sleep() for retry logic. "
                 "Combined with asyncio code it could lead to deadlocks and other unexpected behaviour. "
                 "Please consider decorating an async function instead."
             )
+            wrapper = _build_retry_sync(
+                callable_to_secure,  # type: ignore[arg-type]
+                catcher_executor,
+                catcher_retrier,
+                retry_stepping_func,
+                max_retries,
+            )
 
-            def retry_function_sync(*args: _P.args, **kwargs: _P.kwargs) -> _T:
-                generator = retry_generator(*args, **kwargs)
-                while True:
-                    next(generator)
-                    try:
-                        retry_count_ = generator.send(
-                            catcher_executor.secure_call(callable_to_secure, *args, **kwargs)  # type: ignore[arg-type]
-                        )
-                    except StopIteration as stop_iteration:
-                        return stop_iteration.value
-                    time.sleep(retry_stepping_func(retry_count_))
-
-            @functools.wraps(callable_to_secure)
-            def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _T:
-                result = catcher_retrier.secure_call(retry_function_sync, *args, **kwargs)
-                return handle_result_and_call_callbacks(result, *args, **kwargs)
-
-        return_func = cast(FunctionType[_P, _T] | AsyncFunctionType[_P, _T], wrapper)
-        return_func.__catcher__ = catcher_retrier  # type: ignore[union-attr]
-        return_func.__original_callable__ = callable_to_secure  # type: ignore[union-attr]
-        return return_func
+        wrapper.__catcher__ = catcher_retrier  # type: ignore[union-attr]
+        wrapper.__original_callable__ = callable_to_secure  # type: ignore[union-attr]
+        return wrapper
 
     return decorator_inner  # type: ignore[return-value]
 
@@ -319,12 +388,22 @@ def decorator(
             suppress_recalling_on_error=suppress_recalling_on_error,
         )(func)
 
-        def handle_result(result: ResultType[_T]) -> _T:
-            if isinstance(result, PositiveResult):
-                return result.result
-            if isinstance(on_error_return_always, UnsetType):
+        # Whether to raise or to return a default value on errors is known upfront, so it is decided once here
+        # instead of on every call.
+        if isinstance(on_error_return_always, UnsetType):
+
+            def handle_result(result: ResultType[_T]) -> _T:
+                if isinstance(result, PositiveResult):
+                    return result.result
                 raise result.error
-            return on_error_return_always
+
+        else:
+            error_return_value = on_error_return_always
+
+            def handle_result(result: ResultType[_T]) -> _T:
+                if isinstance(result, PositiveResult):
+                    return result.result
+                return error_return_value
 
         if iscoroutinefunction(secured_func):
 
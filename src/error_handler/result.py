@@ -21,7 +21,7 @@ class CallbackResultType(StrEnum):
     SKIPPED = "skipped"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CallbackResultTypes:
     """
     Contains the information for each callback whether a callback was successful or errored or not called aka skipped.
@@ -32,7 +32,7 @@ class CallbackResultTypes:
     finalize: CallbackResultType = CallbackResultType.SKIPPED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReturnValues:
     """
     Contains the return values of each callback.
@@ -45,7 +45,7 @@ class ReturnValues:
     finalize: Any = UNSET
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CallbackSummary:
     """
     Contains the information of the result of a secured context and its callbacks.
@@ -55,6 +55,8 @@ class CallbackSummary:
     callback_return_values: ReturnValues
 
 
+# The generic results don't use slots=True: it recreates the class, which breaks the frozen __setattr__ when typing
+# sets __orig_class__ on subscripted construction (e.g. PositiveResult[int](result=3)) on Python < 3.13.
 @dataclass(frozen=True)
 class PositiveResult(Generic[T]):
     """
@@ -0,0 +1,49 @@
+"""
+This module contains a scheduler which can be shared between retry decorators to group the waiting times of retries.
+"""
+
+import asyncio
+import math
+import weakref
+
+
+# pylint: disable=too-few-public-methods
+class RetryScheduler:
+    """
+    A scheduler which can be passed to multiple retry_on_error decorators (async only).
+    Instead of scheduling an own timer for each retry, the retries are grouped into buckets of `quantum` seconds.
+    All retries which are due in the same bucket share a single timer of the event loop and are woken up together.
+    A retry may therefore wait up to `quantum` seconds longer than requested but never shorter.
+    """
+
+    def __init__(self, quantum: float = 0.01):
+        if quantum <= 0:
+            raise ValueError(f"The quantum must be positive, got {quantum}")
+        self.quantum = quantum
+        self._buckets: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[int, list[asyncio.Future[None]]]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def sleep(self, delay: float) -> None:
+        """
+        Waits at least `delay` seconds. It can be used as drop-in replacement for asyncio.sleep.
+        """
+        loop = asyncio.get_running_loop()
+        buckets = self._buckets.setdefault(loop, {})
+        bucket_key = math.ceil((loop.time() + delay) / self.quantum)
+        future: asyncio.Future[None] = loop.create_future()
+        bucket = buckets.get(bucket_key)
+        if bucket is None:
+            bucket = buckets[bucket_key] = []
+            loop.call_at(bucket_key * self.quantum, self._release, buckets, bucket_key)
+        bucket.append(future)
+        await future
+
+    @staticmethod
+    def _release(buckets: dict[int, list[asyncio.Future[None]]], bucket_key: int) -> None:
+        """
+        Wakes up all retries of the given bucket. Retries which were cancelled in the meantime are skipped.
+        """
+        for future in buckets.pop(bucket_key):
+            if not future.done():
+                future.set_result(None)
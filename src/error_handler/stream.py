@@ -4,10 +4,11 @@ This module contains pipable operators that are used to handle errors in aiostre
 
 import asyncio
 import logging
+import operator
 import sys
 from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Coroutine
 
-from . import NegativeResult, PositiveResult, ResultType
+from . import PositiveResult, ResultType
 from ._extra import IS_AIOSTREAM_INSTALLED
 from .decorator import decorator_as_result
 from .types import is_secured
@@ -16,7 +17,34 @@ if IS_AIOSTREAM_INSTALLED:
     import aiostream
     from aiostream.stream.combine import T, U
 
-    # pylint: disable=too-many-arguments, redefined-builtin
+    # Bound once, so building a pipeline doesn't have to walk through the aiostream modules every time.
+    _aiostream_map_raw = aiostream.stream.map.raw
+    _aiostream_filter_raw = aiostream.stream.filter.raw
+    _aiostream_chunks_raw = aiostream.stream.chunks.raw
+    _aiostream_concatmap_raw = aiostream.stream.concatmap.raw
+
+    def _apply_to_batches(
+        secured_func: Callable[[T], Awaitable[ResultType[U]]] | Callable[[T], ResultType[U]],
+    ) -> Callable[[list[T]], AsyncIterator[ResultType[U]]]:
+        """
+        Returns an async generator function which applies the secured function to all items of a batch and yields the
+        results in order. The items of a batch are awaited concurrently if the secured function is a coroutine function.
+        """
+        if asyncio.iscoroutinefunction(secured_func):
+
+            async def apply_to_batch(batch: list[T]) -> AsyncIterator[ResultType[U]]:
+                for result in await asyncio.gather(*(secured_func(item) for item in batch)):
+                    yield result
+
+        else:
+
+            async def apply_to_batch(batch: list[T]) -> AsyncIterator[ResultType[U]]:
+                for item in batch:
+                    yield secured_func(item)  # type: ignore[misc]
+
+        return apply_to_batch
+
+    # pylint: disable=too-many-arguments, too-many-locals, redefined-builtin
     @aiostream.pipable_operator
     def map(
         source: AsyncIterable[T],
@@ -30,13 +58,24 @@ if IS_AIOSTREAM_INSTALLED:
         wrap_secured_function: bool = False,
         suppress_recalling_on_error: bool = True,
         logger: logging.Logger = logging.getLogger(__name__),
+        batch_size: int | None = None,
     ) -> AsyncIterator[U]:
         """
         This operator does mostly the same as stream.map of aiostream.
         Additionally, it catches all errors, calls the corresponding callbacks and filters out errored results.
         If suppress_recalling_on_error is True, the on_error callable will not be called if the error were already
         caught by a previous catcher.
+        If batch_size is set, the items are collected into batches of this size and the items of a batch are processed
+        concurrently. The order of the items is always preserved in this case and task_limit limits the number of
+        batches being processed at the same time. It cannot be combined with more_sources or ordered=False.
         """
+        if batch_size is not None:
+            if batch_size < 1:
+                raise ValueError(f"The batch_size must be positive, got {batch_size}")
+            if more_sources:
+                raise ValueError("batch_size cannot be combined with more_sources.")
+            if not ordered:
+                raise ValueError("batch_size cannot be combined with ordered=False.")
         if not wrap_secured_function and is_secured(func):
             if (
                 on_success is not None
@@ -65,19 +104,27 @@ if IS_AIOSTREAM_INSTALLED:
             )
             # Ignore that T | ErroredType is not compatible with T. All ErroredType results are filtered out
             # in a subsequent step.
-        results: AsyncIterator[ResultType[U]] = aiostream.stream.map.raw(
-            source, secured_func, *more_sources, ordered=ordered, task_limit=task_limit  # type: ignore[arg-type]
-        )
-        positive_results: AsyncIterator[PositiveResult[U]] = aiostream.stream.filter.raw(
+        results: AsyncIterator[ResultType[U]]
+        if batch_size is None:
+            results = _aiostream_map_raw(
+                source, secured_func, *more_sources, ordered=ordered, task_limit=task_limit  # type: ignore[arg-type]
+            )
+        else:
+            results = _aiostream_concatmap_raw(
+                _aiostream_chunks_raw(source, batch_size),  # type: ignore[arg-type]
+                _apply_to_batches(secured_func),  # type: ignore[arg-type]
+                task_limit=task_limit,
+            )
+        positive_results: AsyncIterator[PositiveResult[U]] = _aiostream_filter_raw(
             results,  # type: ignore[arg-type]
             # mypy can't successfully narrow the type here.
-            lambda result: not isinstance(result, NegativeResult),
+            lambda result: isinstance(result, PositiveResult),
         )
-        result_values: AsyncIterator[U] = aiostream.stream.map.raw(
+        # The mapping is a builtin callable (instead of a lambda), so aiostream doesn't have to call into a Python
+        # function for every item.
+        result_values: AsyncIterator[U] = _aiostream_map_raw(
             positive_results,
-            lambda result: (  # type: ignore[arg-type, misc]
-                result.result if isinstance(result, PositiveResult) else result
-            ),
+            operator.attrgetter("result"),  # type: ignore[arg-type]
         )
         return result_values
 
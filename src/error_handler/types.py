@@ -67,6 +67,22 @@ Represents an unset value. It is used as default value for parameters that can b
 """
 
 
+_CALLBACK_ERROR_PARAM = inspect.Parameter("error", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=BaseException)
+"""
+The parameter which is prepended to the expected signature of error callbacks.
+"""
+
+_EMPTY_SIGNATURE = inspect.Signature()
+"""
+An empty signature. Signatures are immutable, so it can safely be shared.
+"""
+
+_EMPTY_ANY_SIGNATURE = inspect.Signature(return_annotation=Any)
+"""
+An empty signature returning Any. Signatures are immutable, so it can safely be shared.
+"""
+
+
 FunctionType: TypeAlias = Callable[P, T]
 AsyncFunctionType: TypeAlias = Callable[P, Coroutine[Any, Any, T]]
 
@@ -1,34 +1,42 @@
-import builtins
 import importlib
 import sys
 
 import pytest
+import pytest_asyncio
 
+import error_handler
 
-@pytest.fixture(scope="function")
-def trigger_aiostream_import_error():
-    realimport = builtins.__import__
 
-    def myimport(name, global_vars, local_vars, fromlist, level):
-        if name.startswith("aiostream"):
-            raise ImportError
-        return realimport(name, global_vars, local_vars, fromlist, level)
+def pytest_collection_modifyitems(items):
+    # Run all async tests in one event loop instead of creating and closing a new loop for every single test.
+    session_loop_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop_marker, append=False)
 
-    builtins.__import__ = myimport
 
-    modules_to_reload = [
+@pytest.fixture(scope="function")
+def trigger_aiostream_import_error():
+    modules_to_replace = [
         "error_handler._extra",
         "error_handler.stream",
         "error_handler.pipe",
-        "error_handler",
     ]
-    for module in modules_to_reload:
-        importlib.reload(importlib.import_module(module))
-
-    yield myimport
-
-    builtins.__import__ = realimport
-
-    for module in modules_to_reload:
-        sys.modules.pop(module)
-        importlib.reload(importlib.import_module(module))
+    saved_modules = {module: sys.modules.pop(module) for module in modules_to_replace if module in sys.modules}
+    saved_aiostream = sys.modules.get("aiostream")
+    # A None entry in sys.modules makes every `import aiostream` raise an ImportError.
+    sys.modules["aiostream"] = None  # type: ignore[assignment]
+    for module in modules_to_replace:
+        setattr(error_handler, module.rsplit(".", 1)[1], importlib.import_module(module))
+
+    yield
+
+    if saved_aiostream is None:
+        del sys.modules["aiostream"]
+    else:
+        sys.modules["aiostream"] = saved_aiostream
+    for module in modules_to_replace:
+        sys.modules.pop(module, None)
+    for module, saved_module in saved_modules.items():
+        sys.modules[module] = saved_module
+        setattr(error_handler, module.rsplit(".", 1)[1], saved_module)
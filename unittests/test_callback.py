@@ -0,0 +1,179 @@
+import functools
+import gc
+import inspect
+import weakref
+from typing import Any
+
+import pytest
+
+from error_handler.callback import _SIGNATURE_CACHE, Callback, ErrorCallback, SuccessCallback
+
+
+class TestCallback:
+    def test_signature_cache_shared_between_instances(self):
+        def callback(hello: str) -> str:
+            return hello
+
+        callback_1 = Callback(callback, inspect.Signature())
+        callback_2 = Callback(callback, inspect.Signature())
+        assert callback_1.actual_signature is callback_2.actual_signature
+        assert _SIGNATURE_CACHE[callback] is callback_1.actual_signature
+
+    def test_signature_cache_not_weakrefable_callable(self):
+        callback = Callback(len, inspect.Signature())
+        assert str(callback.actual_signature) == "(obj, /)"
+        assert callback([1, 2, 3]) == 3
+
+    def test_signature_cache_does_not_keep_not_weakrefable_callable_alive(self):
+        class Payload:
+            pass
+
+        class SlottedCallable:
+            __slots__ = ("payload",)
+
+            def __init__(self, payload: Payload):
+                self.payload = payload
+
+            def __call__(self, hello: str) -> str:
+                return hello
+
+        payload = Payload()
+        payload_ref = weakref.ref(payload)
+        callback = Callback(SlottedCallable(payload), inspect.Signature())
+        assert str(callback.actual_signature) == "(hello: str) -> str"
+        del payload, callback
+        gc.collect()
+        assert payload_ref() is None
+
+    def test_type_error_inside_callback_is_not_rewrapped(self):
+        def callback(hello: str) -> str:
+            raise TypeError(f"This is a test error {hello}")
+
+        with pytest.raises(TypeError) as error:
+            Callback(callback, inspect.Signature())("world")
+
+        assert str(error.value) == "This is a test error world"
+
+    def test_wrong_arguments(self):
+        def callback(hello: str) -> str:
+            return hello
+
+        with pytest.raises(TypeError) as error:
+            Callback(callback, inspect.Signature())("hello", "world")
+
+        assert "Arguments do not match signature of callback callback(hello: str) -> str" in str(error.value)
+        assert error.value.__context__ is None
+
+    def test_from_callable_keeps_signature_if_unchanged(self):
+        def func(hello: str) -> str:
+            return hello
+
+        signature = inspect.signature(func)
+        assert Callback.from_callable(func, signature).expected_signature is signature
+        assert str(Callback.from_callable(func, signature, return_type=Any).expected_signature) == "(hello: str) -> Any"
+
+    def test_from_callable_return_type_none_keeps_return_annotation(self):
+        def func(a) -> int:
+            return a
+
+        assert str(Callback.from_callable(func, func, return_type=None).expected_signature) == "(a) -> int"
+
+    def test_success_callback_expected_signature(self):
+        def func(hello: str) -> str:
+            return hello
+
+        callback = SuccessCallback.from_callable(func, func, return_type=Any)
+        assert str(callback.expected_signature) == "(result: str, hello: str) -> Any"
+
+    def test_signature_from_dunder_signature(self):
+        def callback(*args, **kwargs):
+            return args, kwargs
+
+        signature = inspect.Signature(
+            [inspect.Parameter("hello", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str)]
+        )
+        callback.__signature__ = signature  # type: ignore[attr-defined]
+        assert Callback(callback, inspect.Signature()).actual_signature is signature
+
+    def test_signature_of_bound_method_with_dunder_signature(self):
+        class MyClass:
+            def method(self, hello: str) -> str:
+                return hello
+
+        MyClass.method.__signature__ = inspect.signature(MyClass.method)  # type: ignore[attr-defined]
+        callback = Callback(MyClass().method, inspect.Signature())
+        assert str(callback.actual_signature) == "(hello: str) -> str"
+        assert callback("world") == "world"
+
+    def test_callback_has_no_instance_dict(self):
+        def func(hello: str) -> str:
+            return hello
+
+        for callback in (
+            Callback.from_callable(func, func),
+            ErrorCallback.from_callable(func, func),
+            SuccessCallback.from_callable(func, func),
+        ):
+            assert not hasattr(callback, "__dict__")
+            assert weakref.ref(callback)() is callback
+            assert callback("world") == "world"
+
+    def test_wrapped_callback_wrong_arguments(self):
+        wrapper_calls = []
+
+        def on_error(error: BaseException) -> BaseException:
+            return error
+
+        @functools.wraps(on_error)
+        def wrapped_on_error(*args, **kwargs):
+            wrapper_calls.append(args)
+            return on_error(*args, **kwargs)
+
+        callback = Callback(wrapped_on_error, inspect.Signature())
+        error = ValueError("This is a test error")
+        assert callback(error) is error
+        with pytest.raises(TypeError) as type_error:
+            callback(error, "world")
+
+        assert "Arguments do not match signature of callback on_error(error: BaseException)" in str(type_error.value)
+        assert wrapper_calls == [(error,)]
+
+    def test_callback_with_dunder_signature_wrong_arguments(self):
+        def callback(*args, **kwargs):
+            return args, kwargs
+
+        callback.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+            [inspect.Parameter("hello", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+        )
+        assert Callback(callback, inspect.Signature())("world") == (("world",), {})
+        with pytest.raises(TypeError) as error:
+            Callback(callback, inspect.Signature())("hello", "world")
+
+        assert "Arguments do not match signature of callback callback(hello)" in str(error.value)
+
+    def test_callable_object_with_wrapped_call_wrong_arguments(self):
+        wrapper_calls = []
+
+        def track_calls(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                wrapper_calls.append(args[1:])
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        class OnError:
+            __name__ = "on_error"
+
+            @track_calls
+            def __call__(self, error: BaseException) -> BaseException:
+                return error
+
+        callback = Callback(OnError(), inspect.Signature())
+        error = ValueError("This is a test error")
+        assert callback(error) is error
+        with pytest.raises(TypeError) as type_error:
+            callback(error, "world")
+
+        assert "Arguments do not match signature of callback on_error(error: BaseException)" in str(type_error.value)
+        assert wrapper_calls == [(error,)]
@@ -1,13 +1,18 @@
+import inspect
+import weakref
+
 import pytest
 
 import error_handler
+from error_handler.callback import Callback
+from error_handler.result import CallbackResultType
 
 from .utils import assert_not_called, create_callback_tracker
 
 
 def retry_stepping_func(_: int) -> float:
-    """To speed things up a bit"""
-    return 0.001
+    """Don't wait between retries. Async retries still yield to the event loop through asyncio.sleep(0)."""
+    return 0
 
 
 class TestErrorHandlerDecorator:
@@ -25,8 +30,9 @@ class TestErrorHandlerDecorator:
 
         awaitable = async_function("world")
         result = await awaitable
-        assert str(error_tracker[0][0][0]) == "This is a test error world"
-        assert str(error_tracker[0][0][1]) == "world"
+        (error, hello), _ = error_tracker[0]
+        assert error.args == ("This is a test error world",)
+        assert hello == "world"
         assert isinstance(result, error_handler.NegativeResult)
         assert finalize_tracker == [(("world",), {})]
 
@@ -56,9 +62,10 @@ class TestErrorHandlerDecorator:
             raise ValueError(f"This is a test error {hello}")
 
         result = func("world")
-        assert isinstance(error_tracker[0][0][0], ValueError)
-        assert str(error_tracker[0][0][0]) == "This is a test error world"
-        assert error_tracker[0][0][1] == "world"
+        (error, hello), _ = error_tracker[0]
+        assert isinstance(error, ValueError)
+        assert error.args == ("This is a test error world",)
+        assert hello == "world"
         assert result is None
 
     def test_decorator_function_success_case(self):
@@ -82,9 +89,10 @@ class TestErrorHandlerDecorator:
                 raise ValueError(f"This is a test error {hello}")
 
         result = TestClass.func("world")
-        assert isinstance(error_tracker[0][0][0], ValueError)
-        assert str(error_tracker[0][0][0]) == "This is a test error world"
-        assert error_tracker[0][0][1] == "world"
+        (error, hello), _ = error_tracker[0]
+        assert isinstance(error, ValueError)
+        assert error.args == ("This is a test error world",)
+        assert hello == "world"
         assert result is None
 
     def test_decorator_static_method_success_case(self):
@@ -159,8 +167,9 @@ class TestErrorHandlerDecorator:
         instance = MyClass(42)
         result = instance.func("world")
         assert result is None
-        assert str(error_tracker[0][0][0]) == "This is a test error world"
-        assert error_tracker == [((error_tracker[0][0][0], instance, "world"), {})]
+        (error, *_), __ = error_tracker[0]
+        assert error.args == ("This is a test error world",)
+        assert error_tracker == [((error, instance, "world"), {})]
         assert finalize_tracker == [((instance, "world"), {})]
 
     async def test_retry_coroutine_return_after_retries(self):
@@ -308,3 +317,85 @@ class TestErrorHandlerDecorator:
         assert result == "Hello world"
         assert success_tracker == [(("Hello world", 2, "world"), {})]
         assert finalize_tracker == [((2, "world"), {})]
+
+    def test_decorator_without_callbacks(self):
+        # pylint: disable=no-member
+        @error_handler.decorator_as_result()
+        def func(hello: str) -> str:
+            if hello == "world":
+                raise ValueError(f"This is a test error {hello}")
+            return f"Hello {hello}"
+
+        success_result = func("World!")
+        assert isinstance(success_result, error_handler.PositiveResult)
+        assert success_result.result == "Hello World!"
+        success_summary = func.__catcher__.handle_success_case(success_result.result, "World!")
+        assert success_summary.callback_result_types.success == CallbackResultType.SKIPPED
+        assert success_summary.callback_result_types.finalize == CallbackResultType.SKIPPED
+        assert not hasattr(func.__catcher__, "__dict__")
+        assert weakref.ref(func.__catcher__)() is func.__catcher__
+
+        error_result = func("world")
+        assert isinstance(error_result, error_handler.NegativeResult)
+        assert error_result.error.__caught_by_catcher__ == [func.__catcher__]  # type: ignore[attr-defined]
+
+    def test_decorator_none_result_is_shared(self):
+        @error_handler.decorator_as_result()
+        def func(hello: str) -> None:
+            assert hello
+
+        first_result = func("World!")
+        assert isinstance(first_result, error_handler.PositiveResult)
+        assert first_result.result is None
+        assert func("World!") is first_result
+
+    async def test_decorator_only_error_callback(self):
+        on_error_callback, error_tracker = create_callback_tracker()
+
+        @error_handler.decorator_as_result(on_error=on_error_callback)
+        def func(hello: str) -> str:
+            if hello == "world":
+                raise ValueError(f"This is a test error {hello}")
+            return f"Hello {hello}"
+
+        @error_handler.decorator_as_result(on_error=on_error_callback)
+        async def async_func(hello: str) -> str:
+            return func.__original_callable__(hello)
+
+        for secured_func_result in (func("World!"), await async_func("World!")):
+            assert isinstance(secured_func_result, error_handler.PositiveResult)
+            assert secured_func_result.result == "Hello World!"
+        assert len(error_tracker) == 0
+
+        for secured_func_result in (func("world"), await async_func("world")):
+            assert isinstance(secured_func_result, error_handler.NegativeResult)
+        assert [args[1:] for args, _ in error_tracker] == [("world",), ("world",)]
+
+    async def test_decorator_preserves_metadata(self):
+        @error_handler.decorator(on_error_return_always=None)
+        async def async_function(hello: str) -> str:
+            """Says hello."""
+            return f"Hello {hello}"
+
+        assert async_function.__name__ == "async_function"
+        assert async_function.__doc__ == "Says hello."
+        assert str(inspect.signature(async_function)) == "(hello: str) -> str"
+        assert await async_function("World!") == "Hello World!"
+
+    def test_retry_large_max_retries(self):
+        @error_handler.retry_on_error(on_error=assert_not_called, max_retries=2000)
+        def func(hello: str) -> str:
+            return f"Hello {hello}"
+
+        assert func("World!") == "Hello World!"
+
+    def test_decorator_success_callback_set_after_decoration(self):
+        on_success_callback, success_tracker = create_callback_tracker()
+
+        @error_handler.decorator_as_result()
+        def func(hello: str) -> str:
+            return f"Hello {hello}"
+
+        func.__catcher__.on_success = Callback(on_success_callback, inspect.Signature())
+        func("World!")
+        assert success_tracker == [(("Hello World!", "World!"), {})]
@@ -1,70 +1,60 @@
+import asyncio
+import importlib
+import re
+from typing import Any, Callable
+
 import pytest
-from aiostream import stream
+from aiostream import Stream, stream
 
 import error_handler
 
-from .utils import create_callback_tracker
-
-
-class TestErrorHandlerPipableOperators:
-    def test_aiostream_import_error(self, trigger_aiostream_import_error):
-        with pytest.raises(ImportError) as error:
-            _ = error_handler.stream.map
-
-        assert "aiostream not found" in str(error.value)
-
-        with pytest.raises(ImportError) as error:
-            _ = error_handler.pipe.map
-
-        assert "aiostream not found" in str(error.value)
-
-    def test_aiostream_import_error_import_from_init(self, trigger_aiostream_import_error):
-        # pylint: disable=import-outside-toplevel, reimported
-        from error_handler import pipe, stream
-
-        with pytest.raises(ImportError) as error:
-            _ = stream.map
-
-        assert "aiostream not found" in str(error.value)
-
-        with pytest.raises(ImportError) as error:
-            _ = pipe.map
-
-        assert "aiostream not found" in str(error.value)
+from .utils import collect_set, create_callback_tracker
 
-    def test_aiostream_import_error_import_from_submodule(self, trigger_aiostream_import_error):
-        # pylint: disable=import-outside-toplevel, redefined-builtin, unused-import
-        with pytest.raises(ImportError) as error:
-            from error_handler.stream import map
+AIOSTREAM_NOT_FOUND = re.compile("aiostream not found")
+NUMBERS = (1, 2, 3, 4, 5, 6)
+ODD_NUMBERS = frozenset((1, 3, 5))
+EVEN_NUMBERS = frozenset((2, 4, 6))
 
-        assert "aiostream not found" in str(error.value)
 
-        with pytest.raises(ImportError) as error:
-            from error_handler.pipe import map
+@pytest.fixture
+def number_stream() -> Stream[int]:
+    return stream.iterate(NUMBERS)
 
-        assert "aiostream not found" in str(error.value)
 
-    async def test_secured_map_stream(self):
+class TestErrorHandlerPipableOperators:
+    @pytest.mark.parametrize(
+        "access_map",
+        [
+            pytest.param(lambda: error_handler.stream.map, id="stream"),
+            pytest.param(lambda: error_handler.pipe.map, id="pipe"),
+            pytest.param(lambda: importlib.import_module("error_handler.stream").map, id="stream_submodule"),
+            pytest.param(lambda: importlib.import_module("error_handler.pipe").map, id="pipe_submodule"),
+        ],
+    )
+    def test_aiostream_import_error(self, trigger_aiostream_import_error, access_map: Callable[[], Any]):
+        with pytest.raises(ImportError, match=AIOSTREAM_NOT_FOUND):
+            access_map()
+
+    async def test_secured_map_stream(self, number_stream):
         errored_nums: set[int] = set()
-        op = stream.iterate([1, 2, 3, 4, 5, 6])
+        op = number_stream
 
         def raise_for_even(num: int) -> int:
             if num % 2 == 0:
-                raise ValueError(f"{num}")
+                raise ValueError(num)
             return num
 
         def store(error: Exception, _: int):
             nonlocal errored_nums
-            errored_nums.add(int(str(error)))
+            errored_nums.add(error.args[0])
 
         op = error_handler.stream.map(op, raise_for_even, on_error=store)
 
-        elements = await stream.list(op)
-        assert set(elements) == {1, 3, 5}
-        assert errored_nums == {2, 4, 6}
+        assert await collect_set(op) == ODD_NUMBERS
+        assert errored_nums == EVEN_NUMBERS
 
-    async def test_secured_map_stream_double_secure_invalid_arguments(self):
-        op = stream.iterate([1, 2, 3, 4, 5, 6])
+    async def test_secured_map_stream_double_secure_invalid_arguments(self, number_stream):
+        op = number_stream
 
         @error_handler.decorator_as_result()
         def return_1(_: int) -> int:
@@ -75,11 +65,11 @@ class TestErrorHandlerPipableOperators:
 
         assert "Please do not set on_success, on_error, on_finalize as they would be ignored" in str(error.value)
 
-    async def test_secured_map_stream_double_secure_no_wrap(self):
+    async def test_secured_map_stream_double_secure_no_wrap(self, number_stream):
         error_callback, error_tracker = create_callback_tracker()
         success_callback, success_tracker = create_callback_tracker()
 
-        op = stream.iterate([1, 2, 3, 4, 5, 6])
+        op = number_stream
 
         @error_handler.decorator_as_result(on_error=error_callback, on_success=success_callback)
         def raise_for_even(num: int) -> int:
@@ -89,74 +79,119 @@ class TestErrorHandlerPipableOperators:
 
         op = error_handler.stream.map(op, raise_for_even)
 
-        elements = await stream.list(op)
-        assert set(elements) == {1, 3, 5}
+        assert await collect_set(op) == ODD_NUMBERS
         errored_nums = {error.args[0] for (error, _), __ in error_tracker}
-        assert errored_nums == {2, 4, 6}
+        assert errored_nums == EVEN_NUMBERS
         succeeded_nums = {num_returned for (num_returned, _), __ in success_tracker}
-        assert succeeded_nums == {1, 3, 5}
+        assert succeeded_nums == ODD_NUMBERS
 
-    async def test_secured_map_stream_double_secure_wrap(self):
+    async def test_secured_map_stream_double_secure_wrap(self, number_stream):
         errored_nums_from_map: set[int] = set()
         errored_nums_from_decorator: set[int] = set()
-        op = stream.iterate([1, 2, 3, 4, 5, 6])
+        op = number_stream
 
         def store_from_map(error: Exception, _: int):
             nonlocal errored_nums_from_map
-            errored_nums_from_map.add(int(str(error)))
+            errored_nums_from_map.add(error.args[0])
 
         def store_from_decorator(error: Exception, _: int):
             nonlocal errored_nums_from_decorator
-            errored_nums_from_decorator.add(int(str(error)))
+            errored_nums_from_decorator.add(error.args[0])
             raise error
 
         @error_handler.decorator(on_error=store_from_decorator)
         def raise_for_even(num: int) -> int:
             if num % 2 == 0:
-                raise ValueError(f"{num}")
+                raise ValueError(num)
             return num
 
         op = error_handler.stream.map(
             op, raise_for_even, on_error=store_from_map, wrap_secured_function=True, suppress_recalling_on_error=False
         )
 
-        elements = await stream.list(op)
-        assert set(elements) == {1, 3, 5}
-        assert errored_nums_from_map == errored_nums_from_decorator == {2, 4, 6}
+        assert await collect_set(op) == ODD_NUMBERS
+        assert errored_nums_from_map == errored_nums_from_decorator == EVEN_NUMBERS
 
-    async def test_secured_map_pipe(self):
+    async def test_secured_map_pipe(self, number_stream):
         errored_nums: set[int] = set()
-        op = stream.iterate([1, 2, 3, 4, 5, 6])
+        op = number_stream
 
         def raise_for_even(num: int) -> int:
             if num % 2 == 0:
-                raise ValueError(f"{num}")
+                raise ValueError(num)
             return num
 
         def store(error: Exception, _: int):
             nonlocal errored_nums
-            errored_nums.add(int(str(error)))
+            errored_nums.add(error.args[0])
 
         op = op | error_handler.pipe.map(raise_for_even, on_error=store)
 
-        elements = await stream.list(op)
-        assert set(elements) == {1, 3, 5}
-        assert errored_nums == {2, 4, 6}
+        assert await collect_set(op) == ODD_NUMBERS
+        assert errored_nums == EVEN_NUMBERS
 
-    async def test_secured_action_pipe(self):
+    async def test_secured_action_pipe(self, number_stream):
         errored_nums: set[int] = set()
-        op = stream.iterate([1, 2, 3, 4, 5, 6])
+        op = number_stream
 
         def raise_for_even(num: int):
             if num % 2 == 0:
-                raise ValueError(f"{num}")
+                raise ValueError(num)
 
         def store(error: Exception, _: int):
             nonlocal errored_nums
-            errored_nums.add(int(str(error)))
+            errored_nums.add(error.args[0])
 
         op = op | error_handler.pipe.action(raise_for_even, on_error=store)
 
+        assert await collect_set(op) == ODD_NUMBERS
+        assert errored_nums == EVEN_NUMBERS
+
+    async def test_secured_map_pipe_batched(self):
+        errored_nums: set[int] = set()
+        op = stream.iterate(range(1, 8))
+
+        async def raise_for_even(num: int) -> int:
+            await asyncio.sleep(0.01 * (7 - num))
+            if num % 2 == 0:
+                raise ValueError(num)
+            return num
+
+        def store(error: Exception, _: int):
+            nonlocal errored_nums
+            errored_nums.add(error.args[0])
+
+        op = op | error_handler.pipe.map(raise_for_even, on_error=store, batch_size=3)
+
         elements = await stream.list(op)
-        assert set(elements) == {1, 3, 5}
-        assert errored_nums == {2, 4, 6}
+        assert elements == [1, 3, 5, 7]
+        assert errored_nums == EVEN_NUMBERS
+
+    async def test_secured_map_stream_batched_sync(self):
+        success_callback, success_tracker = create_callback_tracker()
+        op = stream.iterate([1, 2, 3, 4, 5])
+
+        op = error_handler.stream.map(op, lambda num: num * 2, on_success=success_callback, batch_size=2)
+
+        elements = await stream.list(op)
+        assert elements == [2, 4, 6, 8, 10]
+        assert success_tracker == [((num * 2, num), {}) for num in range(1, 6)]
+
+    async def test_secured_map_stream_batched_more_sources(self):
+        with pytest.raises(ValueError) as error:
+            _ = error_handler.stream.map(stream.iterate([1]), max, stream.iterate([2]), batch_size=2)
+
+        assert "batch_size cannot be combined with more_sources" in str(error.value)
+
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    async def test_secured_map_stream_batched_invalid_batch_size(self, number_stream, batch_size: int):
+        with pytest.raises(ValueError) as error:
+            _ = error_handler.stream.map(number_stream, abs, batch_size=batch_size)
+
+        assert f"The batch_size must be positive, got {batch_size}" in str(error.value)
+
+    async def test_secured_map_stream_batched_unordered(self, number_stream):
+        with pytest.raises(ValueError) as error:
+            _ = error_handler.stream.map(number_stream, abs, ordered=False, batch_size=2)
+
+        assert "batch_size cannot be combined with ordered=False" in str(error.value)
@@ -0,0 +1,10 @@
+import error_handler
+
+
+class TestResult:
+    def test_subscripted_construction(self):
+        positive_result = error_handler.PositiveResult[int](result=3)
+        error = ValueError("This is a test error")
+        negative_result = error_handler.NegativeResult[int](error=error)
+        assert positive_result.result == 3
+        assert negative_result.error is error
@@ -0,0 +1,57 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+import error_handler
+
+from .utils import assert_not_called, create_callback_tracker
+
+
+class TestRetryScheduler:
+    async def test_retry_scheduler_shared_between_functions(self):
+        retry_scheduler = error_handler.RetryScheduler(quantum=0.05)
+        error_callback, error_tracker = create_callback_tracker(additional_callback=lambda *_: True)
+        calls: dict[str, int] = {}
+
+        @error_handler.retry_on_error(
+            on_error=error_callback,
+            on_fail=assert_not_called,
+            retry_stepping_func=lambda _: 0.01,
+            retry_scheduler=retry_scheduler,
+        )
+        async def async_function(hello: str) -> str:
+            calls[hello] = calls.get(hello, 0) + 1
+            if calls[hello] < 3:
+                raise ValueError(f"This is a test error {hello}")
+            return f"Hello {hello}"
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        with mock.patch.object(loop, "call_at", wraps=loop.call_at) as call_at:
+            results = await asyncio.gather(*(async_function(str(index)) for index in range(10)))
+        assert results == [f"Hello {index}" for index in range(10)]
+        assert len(error_tracker) == 20
+        # The 10 retries of each round fall into the same bucket and are woken up by a single timer.
+        assert call_at.call_count == 2
+        assert loop.time() - start >= 0.02
+        assert not retry_scheduler._buckets[loop]  # pylint: disable=protected-access
+
+    async def test_retry_scheduler_cancelled_sleep(self):
+        retry_scheduler = error_handler.RetryScheduler()
+        cancelled_sleep = asyncio.create_task(retry_scheduler.sleep(0.01))
+        await asyncio.sleep(0)
+        cancelled_sleep.cancel()
+        await retry_scheduler.sleep(0.01)
+        assert cancelled_sleep.cancelled()
+
+    def test_retry_scheduler_sync_function(self):
+        with pytest.raises(ValueError):
+
+            @error_handler.retry_on_error(on_error=assert_not_called, retry_scheduler=error_handler.RetryScheduler())
+            def func(hello: str) -> str:
+                return hello
+
+    def test_retry_scheduler_invalid_quantum(self):
+        with pytest.raises(ValueError):
+            error_handler.RetryScheduler(quantum=0)
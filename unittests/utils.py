@@ -5,6 +5,24 @@ def assert_not_called(*_, **__):
     raise ValueError("This should not be called")
 
 
+class CallbackTracker:
+    """
+    A callback taking any arguments which stores all calls to it in the call_args list.
+    It will call the additional_callback with the same arguments and return its return value.
+    """
+
+    __slots__ = ("call_args", "additional_callback", "__weakref__")
+    __name__ = "callback"
+
+    def __init__(self, additional_callback: Callable):
+        self.call_args: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self.additional_callback = additional_callback
+
+    def __call__(self, *args, **kwargs):
+        self.call_args.append((args, kwargs))
+        return self.additional_callback(*args, **kwargs)
+
+
 def create_callback_tracker(
     additional_callback: Callable = lambda *args, **kwargs: None,
 ) -> tuple[Callable, list[tuple[tuple[Any, ...], dict[str, Any]]]]:
@@ -14,10 +32,13 @@ def create_callback_tracker(
     It will also store the arguments as tuple in the call_args list.
     Returns the callback and the call_args list.
     """
-    call_args = []
+    callback = CallbackTracker(additional_callback)
+    return callback, callback.call_args
 
-    def callback(*args, **kwargs):
-        call_args.append((args, kwargs))
-        return additional_callback(*args, **kwargs)
 
-    return callback, call_args
+async def collect_set(op: Any) -> set[Any]:
+    """
+    Streams all elements of the given aiostream operator and returns them as a set.
+    """
+    async with op.stream() as streamer:
+        return {element async for element in streamer}